@@ -97,6 +97,9 @@ class EventStore:
     def __init__(self):
         """Initialize the event store."""
         self.events: List[WelcomeEvent] = []
+        # Secondary indexes so queries don't have to scan every event
+        self._events_by_aggregate: Dict[Optional[str], List[WelcomeEvent]] = {}
+        self._events_by_type: Dict[WelcomeEventType, List[WelcomeEvent]] = {}
         self._lock = threading.RLock()  # Reentrant lock for thread safety
     
     def append(self, event: WelcomeEvent) -> None:
@@ -111,6 +114,8 @@ class EventStore:
         """
         with self._lock:
             self.events.append(event)
+            self._events_by_aggregate.setdefault(event.aggregate_id, []).append(event)
+            self._events_by_type.setdefault(event.event_type, []).append(event)
             logger.info(f"Event stored: {event.event_type.value} for {event.aggregate_id}")
     
     def get_events_by_aggregate(self, aggregate_id: str) -> List[WelcomeEvent]:
@@ -124,7 +129,7 @@ class EventStore:
             List of events for the specified aggregate.
         """
         with self._lock:
-            return [event for event in self.events if event.aggregate_id == aggregate_id]
+            return list(self._events_by_aggregate.get(aggregate_id, ()))
     
     def get_events_by_type(self, event_type: WelcomeEventType) -> List[WelcomeEvent]:
         """
@@ -137,7 +142,7 @@ class EventStore:
             List of events of the specified type.
         """
         with self._lock:
-            return [event for event in self.events if event.event_type == event_type]
+            return list(self._events_by_type.get(event_type, ()))
 
 
 class EventPublisher:
@@ -155,6 +160,9 @@ class EventPublisher:
     def __init__(self):
         """Initialize the event publisher."""
         self.subscribers: Dict[WelcomeEventType, Set[Callable]] = {}
+        # Immutable per-type snapshots rebuilt on (un)subscribe, so publish
+        # can iterate them without copying the subscriber set every event
+        self._subscriber_snapshots: Dict[WelcomeEventType, tuple] = {}
         self._lock = threading.RLock()
     
     def subscribe(self, event_type: WelcomeEventType, callback: Callable) -> None:
@@ -169,6 +177,7 @@ class EventPublisher:
             if event_type not in self.subscribers:
                 self.subscribers[event_type] = set()
             self.subscribers[event_type].add(callback)
+            self._subscriber_snapshots[event_type] = tuple(self.subscribers[event_type])
     
     def unsubscribe(self, event_type: WelcomeEventType, callback: Callable) -> None:
         """
@@ -181,6 +190,7 @@ class EventPublisher:
         with self._lock:
             if event_type in self.subscribers:
                 self.subscribers[event_type].discard(callback)
+                self._subscriber_snapshots[event_type] = tuple(self.subscribers[event_type])
     
     def publish(self, event: WelcomeEvent) -> None:
         """
@@ -193,8 +203,8 @@ class EventPublisher:
         Args:
             event: The event to publish.
         """
-        with self._lock:
-            subscribers = self.subscribers.get(event.event_type, set()).copy()
+        # Snapshots are replaced, never mutated, so reading one needs no lock
+        subscribers = self._subscriber_snapshots.get(event.event_type, ())
         
         for subscriber in subscribers:
             try:
@@ -486,6 +496,12 @@ class WelcomeMetricsRepository(Repository):
                     FOREIGN KEY (metrics_id) REFERENCES welcome_metrics (id)
                 )
             ''')
+            
+            # Lets get_by_id seek the timeline rows instead of scanning
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_timeline_metrics
+                ON welcome_timeline (metrics_id, welcome_time)
+            ''')
     
     def get_by_id(self, id: str) -> Optional[WelcomeMetrics]:
         """Get metrics by ID from database."""
@@ -48,15 +48,18 @@ class BasicWelcome:
         Welcome, Alice!
     """
     
+    __slots__ = ("default_greeting", "usage_count")
+    
     def __init__(self):
         """
         Initialize the BasicWelcome object with default values.
         
         The constructor sets up the initial state of the object.
         This is where we define instance attributes that represent
-        the object's data.
+        the object's data. The greeting uses a %-style placeholder,
+        which is cheaper to fill than a str.format template.
         """
-        self.default_greeting = "Welcome, {}!"
+        self.default_greeting = "Welcome, %s!"
         self.usage_count = 0
     
     def welcome_user(self, name: str) -> str:
@@ -79,7 +82,7 @@ class BasicWelcome:
             'Welcome, Bob!'
         """
         self.usage_count += 1
-        return self.default_greeting.format(name)
+        return self.default_greeting % name
 
 
 class PersonalizedWelcome:
@@ -276,6 +279,22 @@ class ConfigurableWelcome:
         self.auto_title_case = auto_title_case
         self.include_count = include_count
         self._welcome_count = 0
+        # Templates with a single bare {} are converted to %s once, so each
+        # welcome can use the cheaper % operator; anything else keeps format.
+        remainder = self.template.replace("{}", "", 1)
+        if "{" in remainder or "}" in remainder or remainder == self.template:
+            self._format_message = self.template.format
+        else:
+            pct_template = self.template.replace("%", "%%").replace("{}", "%s")
+            self._format_message = pct_template.__mod__
+        
+        # The options never change after construction, so the matching
+        # steps are picked once here instead of being re-checked per call.
+        # The renderer is stored as a plain function, not a bound method,
+        # so the object holds no reference to itself.
+        self._process_name = self._strip_and_title if auto_title_case else str.strip
+        self._render = (ConfigurableWelcome._render_with_count if include_count
+                        else ConfigurableWelcome._render_plain)
     
     def welcome_user(self, name: str) -> str:
         """
@@ -292,20 +311,20 @@ class ConfigurableWelcome:
             str: Configured welcome message.
         """
         self._welcome_count += 1
-        
-        # Process name based on configuration
-        processed_name = name.strip()
-        if self.auto_title_case:
-            processed_name = processed_name.title()
-        
-        # Create base message
-        message = self.template.format(processed_name)
-        
-        # Add count if configured
-        if self.include_count:
-            message += f" [Total: {self._welcome_count}]"
-        
-        return message
+        return self._render(self, self._process_name(name))
+    
+    @staticmethod
+    def _strip_and_title(name: str) -> str:
+        """Strip surrounding whitespace and convert the name to title case."""
+        return name.strip().title()
+    
+    def _render_plain(self, processed_name: str) -> str:
+        """Format the message for an already processed name."""
+        return self._format_message(processed_name)
+    
+    def _render_with_count(self, processed_name: str) -> str:
+        """Format the message and append the running welcome count."""
+        return f"{self._format_message(processed_name)} [Total: {self._welcome_count}]"
 
 
 class WelcomeFactory:
@@ -478,6 +497,18 @@ class WelcomeDecorator:
         """
         self.wrapped_welcome = welcome_object
         self.decoration_count = 0
+        
+        # Flatten nested plain decorators once so a welcome runs in a single
+        # frame instead of one frame per level of wrapping; stop at any
+        # subclass that overrides welcome_user so its behaviour still runs
+        chain = []
+        innermost = welcome_object
+        while (isinstance(innermost, WelcomeDecorator)
+               and type(innermost).welcome_user is WelcomeDecorator.welcome_user):
+            chain.append(innermost)
+            innermost = innermost.wrapped_welcome
+        self._chain = tuple(chain)
+        self._innermost = innermost
     
     def welcome_user(self, name: str) -> str:
         """
@@ -493,10 +524,14 @@ class WelcomeDecorator:
         Returns:
             str: Decorated welcome message.
         """
+        # Every decorator in the chain still counts the welcome; _chain
+        # holds only the inner ones so no decorator references itself
         self.decoration_count += 1
+        for decorator in self._chain:
+            decorator.decoration_count += 1
         
         # Get the original message
-        original_message = self.wrapped_welcome.welcome_user(name)
+        original_message = self._innermost.welcome_user(name)
         
         return original_message
 
@@ -30,12 +30,59 @@ Date: 2025
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional
+from collections import Counter, deque
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 import json
+import logging
 import re
 
 
+logger = logging.getLogger(__name__)
+
+# Bound once so per-welcome timestamps skip the datetime attribute lookup
+_now = datetime.now
+
+
+# Compiled once at import; match() anchors at the start, \Z at the end
+_PRO_NAME_RE = re.compile(r'[A-Za-z\s.\-]+\Z')
+
+
+def _clean(name: str) -> Optional[str]:
+    """Strip the name, returning None when nothing is left."""
+    clean_name = name.strip() if name else ''
+    return clean_name or None
+
+
+# Name checks are pure functions of the input string, so repeat names are
+# answered from a bounded cache; keeping them at module level leaves the
+# strategy instances out of the cache key.
+@lru_cache(maxsize=4096)
+def _prepare_formal(name: str) -> Optional[str]:
+    """Strip the name and check the formal length rules."""
+    clean_name = _clean(name)
+    return clean_name if clean_name and 2 <= len(clean_name) <= 50 else None
+
+
+@lru_cache(maxsize=4096)
+def _prepare_casual(name: str) -> Optional[str]:
+    """Accept any name with at least one non-space character."""
+    return _clean(name)
+
+
+@lru_cache(maxsize=4096)
+def _prepare_professional(name: str) -> Optional[str]:
+    """Strip the name and apply the strict professional rules."""
+    clean_name = _clean(name)
+    if clean_name is None or len(clean_name) < 2 or len(clean_name) > 30:
+        return None
+    # Professional names should not contain special characters
+    return clean_name if _PRO_NAME_RE.match(clean_name) else None
+
+
 class WelcomeException(Exception):
     """
     Base exception class for welcome system errors.
@@ -49,6 +96,8 @@ class WelcomeException(Exception):
         user_message (str): A user-friendly error message.
     """
     
+    __slots__ = ('error_code', 'user_message')
+    
     def __init__(self, error_code: str, user_message: str, *args):
         """
         Initialize the welcome exception.
@@ -89,6 +138,8 @@ class WelcomeStrategy(ABC):
     algorithms and making them interchangeable at runtime.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def generate_welcome(self, name: str) -> str:
         """
@@ -114,6 +165,35 @@ class WelcomeStrategy(ABC):
             True if the name is valid, False otherwise.
         """
         pass
+    
+    def prepare(self, name: str) -> Optional[str]:
+        """
+        Validate and clean the input name in a single step.
+        
+        Concrete strategies override this to strip the name only once;
+        the default falls back to validate_input followed by strip.
+        
+        Args:
+            name: The raw name to prepare.
+            
+        Returns:
+            The cleaned name if it is valid, None otherwise.
+        """
+        if not self.validate_input(name):
+            return None
+        return name.strip()
+    
+    def generate_welcome_clean(self, clean_name: str) -> str:
+        """
+        Generate a welcome message for a name already cleaned by prepare.
+        
+        Args:
+            clean_name: A name returned by prepare.
+            
+        Returns:
+            A personalized welcome message.
+        """
+        return self.generate_welcome(clean_name)
 
 
 class FormalWelcomeStrategy(WelcomeStrategy):
@@ -125,17 +205,26 @@ class FormalWelcomeStrategy(WelcomeStrategy):
     behavior for formal greetings.
     """
     
+    __slots__ = ()
+    
     def generate_welcome(self, name: str) -> str:
         """Generate a formal welcome message."""
-        clean_name = name.strip().title()
-        return f"Dear {clean_name}, we are pleased to welcome you to our establishment."
+        return self.generate_welcome_clean(name.strip())
     
     def validate_input(self, name: str) -> bool:
         """Validate name for formal greetings."""
-        if not name or not name.strip():
-            return False
-        clean_name = name.strip()
-        return len(clean_name) >= 2 and len(clean_name) <= 50
+        return self.prepare(name) is not None
+    
+    def prepare(self, name: str) -> Optional[str]:
+        """Strip the name once and check the formal length rules."""
+        return _prepare_formal(name)
+    
+    # The strategies build messages with f-strings on purpose: they compile
+    # to a single BUILD_STRING and measured faster than str.join, + or a
+    # pre-bound str.format for these templates
+    def generate_welcome_clean(self, clean_name: str) -> str:
+        """Generate a formal welcome message from a prepared name."""
+        return f"Dear {clean_name.title()}, we are pleased to welcome you to our establishment."
 
 
 class CasualWelcomeStrategy(WelcomeStrategy):
@@ -146,16 +235,23 @@ class CasualWelcomeStrategy(WelcomeStrategy):
     different validation rules and message format.
     """
     
+    __slots__ = ()
+    
     def generate_welcome(self, name: str) -> str:
         """Generate a casual welcome message."""
-        clean_name = name.strip()
-        return f"Hey {clean_name}! Great to see you!"
+        return self.generate_welcome_clean(name.strip())
     
     def validate_input(self, name: str) -> bool:
         """More lenient validation for casual greetings."""
-        if not name or not name.strip():
-            return False
-        return len(name.strip()) >= 1
+        return self.prepare(name) is not None
+    
+    def prepare(self, name: str) -> Optional[str]:
+        """Any name with at least one non-space character is accepted."""
+        return _prepare_casual(name)
+    
+    def generate_welcome_clean(self, clean_name: str) -> str:
+        """Generate a casual welcome message from a prepared name."""
+        return f"Hey {clean_name}! Great to see you!"
 
 
 class ProfessionalWelcomeStrategy(WelcomeStrategy):
@@ -167,20 +263,48 @@ class ProfessionalWelcomeStrategy(WelcomeStrategy):
     same interface.
     """
     
+    __slots__ = ()
+    
     def generate_welcome(self, name: str) -> str:
         """Generate a professional welcome message."""
-        clean_name = name.strip().title()
-        return f"Welcome {clean_name}. We look forward to our professional collaboration."
+        return self.generate_welcome_clean(name.strip())
     
     def validate_input(self, name: str) -> bool:
         """Strict validation for professional context."""
-        if not name or not name.strip():
-            return False
-        clean_name = name.strip()
-        if len(clean_name) < 2 or len(clean_name) > 30:
-            return False
-        # Professional names should not contain special characters
-        return bool(re.match(r'^[A-Za-z\s\.\-]+$', clean_name))
+        return self.prepare(name) is not None
+    
+    def prepare(self, name: str) -> Optional[str]:
+        """Strip the name once and apply the strict professional rules."""
+        return _prepare_professional(name)
+    
+    def generate_welcome_clean(self, clean_name: str) -> str:
+        """Generate a professional welcome message from a prepared name."""
+        return f"Welcome {clean_name.title()}. We look forward to our professional collaboration."
+
+
+# Built-in strategy types; checking membership here avoids an isinstance
+# MRO walk for the common case while subclasses still pass the fallback
+_STRATEGY_TYPES = frozenset({
+    FormalWelcomeStrategy,
+    CasualWelcomeStrategy,
+    ProfessionalWelcomeStrategy
+})
+
+# Strategies hold no state, so one shared instance of each is enough
+FORMAL = FormalWelcomeStrategy()
+CASUAL = CasualWelcomeStrategy()
+PROFESSIONAL = ProfessionalWelcomeStrategy()
+
+_STRATEGY_REGISTRY: Dict[str, WelcomeStrategy] = {
+    'formal': FORMAL,
+    'casual': CASUAL,
+    'professional': PROFESSIONAL
+}
+
+_VALID_STRATEGIES = frozenset(_STRATEGY_REGISTRY)
+
+# Field names of a usage log entry, in column order
+_LOG_FIELDS = ('timestamp', 'name', 'message', 'strategy')
 
 
 class WelcomeService:
@@ -194,18 +318,37 @@ class WelcomeService:
     
     Attributes:
         strategy: The current welcome strategy being used.
-        usage_log: List of all welcome activities.
+        usage_log: List of all welcome activities (read-only view).
     """
     
-    def __init__(self, strategy: WelcomeStrategy = None):
+    __slots__ = (
+        'strategy', '_strategy_name', '_total_welcomes', '_strategy_counts',
+        '_enable_logging', '_first_activity', '_recent',
+        '_log_timestamps', '_log_names', '_log_messages', '_log_strategies'
+    )
+    
+    def __init__(self, strategy: WelcomeStrategy = None, enable_logging: bool = True):
         """
         Initialize the welcome service with a strategy.
         
         Args:
             strategy: The welcome strategy to use. Defaults to formal.
-        """
-        self.strategy = strategy or FormalWelcomeStrategy()
-        self.usage_log: List[Dict[str, Any]] = []
+            enable_logging: Whether to retain the full activity log; the
+                five most recent activities are always kept.
+        """
+        self.strategy = strategy or FORMAL
+        self._strategy_name = type(self.strategy).__name__
+        # Activity log stored column-wise instead of one dict per entry
+        self._log_timestamps: List[str] = []
+        self._log_names: List[str] = []
+        self._log_messages: List[str] = []
+        self._log_strategies: List[str] = []
+        # Running per-strategy totals so statistics don't rescan the log
+        self._strategy_counts: Counter = Counter()
+        self._enable_logging = enable_logging
+        self._first_activity: Optional[str] = None
+        # Bounded buffer of the latest log entries for statistics
+        self._recent: deque = deque(maxlen=5)
         self._total_welcomes = 0
     
     @property
@@ -218,6 +361,25 @@ class WelcomeService:
         """
         return self._total_welcomes
     
+    @property
+    def strategy_name(self) -> str:
+        """Class name of the current strategy, cached when it is set."""
+        return self._strategy_name
+    
+    @property
+    def usage_log(self) -> List[Dict[str, Any]]:
+        """
+        All welcome activities, one dictionary per entry.
+        
+        The entries are assembled from the log columns on each access.
+        """
+        return self._log_entries(zip(
+            self._log_timestamps,
+            self._log_names,
+            self._log_messages,
+            self._log_strategies
+        ))
+    
     def set_strategy(self, strategy: WelcomeStrategy) -> None:
         """
         Change the welcome strategy at runtime.
@@ -229,14 +391,15 @@ class WelcomeService:
         Args:
             strategy: The new welcome strategy to use.
         """
-        if not isinstance(strategy, WelcomeStrategy):
+        if type(strategy) not in _STRATEGY_TYPES and not isinstance(strategy, WelcomeStrategy):
             raise ConfigurationError(
                 "INVALID_STRATEGY",
                 "Strategy must be an instance of WelcomeStrategy"
             )
         self.strategy = strategy
+        self._strategy_name = type(strategy).__name__
     
-    def welcome_user(self, name: str) -> str:
+    def welcome_user(self, name: str, timestamp: Optional[str] = None) -> str:
         """
         Welcome a user using the current strategy.
         
@@ -246,6 +409,7 @@ class WelcomeService:
         
         Args:
             name: The name of the user to welcome.
+            timestamp: ISO timestamp to log; taken from the clock if omitted.
             
         Returns:
             The generated welcome message.
@@ -253,23 +417,36 @@ class WelcomeService:
         Raises:
             ValidationError: If the name fails validation.
         """
-        # Validate input using current strategy
-        if not self.strategy.validate_input(name):
+        strategy = self.strategy
+        if type(strategy) in _STRATEGY_TYPES:
+            # Built-in strategies validate and clean the name in one pass
+            clean_name = strategy.prepare(name)
+            valid = clean_name is not None
+        else:
+            # Subclasses may override validate_input or generate_welcome,
+            # so anything else goes through the strategy interface
+            clean_name = None
+            valid = strategy.validate_input(name)
+        if not valid:
             raise ValidationError(
                 "INVALID_NAME",
                 f"The name '{name}' is not valid for the current welcome strategy"
             )
         
-        # Generate welcome message
-        welcome_message = self.strategy.generate_welcome(name)
+        # Generate welcome message using current strategy
+        if clean_name is not None:
+            welcome_message = strategy.generate_welcome_clean(clean_name)
+        else:
+            welcome_message = strategy.generate_welcome(name)
         
         # Update internal state
         self._total_welcomes += 1
-        self._log_activity(name, welcome_message)
+        self._log_activity(name, welcome_message, timestamp)
         
         return welcome_message
     
-    def _log_activity(self, name: str, message: str) -> None:
+    def _log_activity(self, name: str, message: str,
+                      timestamp: Optional[str] = None) -> None:
         """
         Log welcome activity for auditing and analytics.
         
@@ -280,14 +457,34 @@ class WelcomeService:
         Args:
             name: The name that was welcomed.
             message: The welcome message that was generated.
+            timestamp: ISO timestamp of the welcome; defaults to now.
         """
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'name': name,
-            'message': message,
-            'strategy': self.strategy.__class__.__name__
-        }
-        self.usage_log.append(log_entry)
+        timestamp = timestamp or _now().isoformat()
+        strategy_name = self._strategy_name
+        
+        if self._first_activity is None:
+            self._first_activity = timestamp
+        self._recent.append((timestamp, name, message, strategy_name))
+        self._strategy_counts[strategy_name] += 1
+        
+        if self._enable_logging:
+            self._log_timestamps.append(timestamp)
+            self._log_names.append(name)
+            self._log_messages.append(message)
+            self._log_strategies.append(strategy_name)
+    
+    @staticmethod
+    def _log_entries(rows) -> List[Dict[str, Any]]:
+        """
+        Build log entry dictionaries from (timestamp, name, message, strategy) rows.
+        
+        Args:
+            rows: Iterable of log rows in _LOG_FIELDS order.
+            
+        Returns:
+            List of log entries with timestamp, name, message and strategy.
+        """
+        return [dict(zip(_LOG_FIELDS, row)) for row in rows]
     
     def get_usage_statistics(self) -> Dict[str, Any]:
         """
@@ -299,27 +496,19 @@ class WelcomeService:
         Returns:
             Dictionary containing various usage statistics.
         """
-        if not self.usage_log:
+        if not self._recent:
             return {}
         
-        # Count welcomes by strategy
-        strategy_counts = {}
-        for entry in self.usage_log:
-            strategy = entry['strategy']
-            strategy_counts[strategy] = strategy_counts.get(strategy, 0) + 1
-        
-        # Get recent activity
-        recent_activities = self.usage_log[-5:] if len(self.usage_log) > 5 else self.usage_log
-        
         return {
             'total_welcomes': self._total_welcomes,
-            'strategy_breakdown': strategy_counts,
-            'recent_activities': recent_activities,
-            'first_activity': self.usage_log[0]['timestamp'] if self.usage_log else None,
-            'last_activity': self.usage_log[-1]['timestamp'] if self.usage_log else None
+            'strategy_breakdown': dict(self._strategy_counts),
+            'recent_activities': self._log_entries(self._recent),
+            'first_activity': self._first_activity,
+            'last_activity': self._recent[-1][0]
         }
 
 
+@dataclass(frozen=True)
 class WelcomeConfiguration:
     """
     Configuration class for welcome system settings.
@@ -327,27 +516,35 @@ class WelcomeConfiguration:
     This class demonstrates the use of objects to manage
     configuration data, with validation and default values.
     It shows how OOP can make configuration management
-    more robust and self-documenting.
+    more robust and self-documenting. Instances are immutable
+    and hashable, and are validated once when created.
     
     Attributes:
         default_strategy: The default welcome strategy type.
         enable_logging: Whether to enable activity logging.
         max_name_length: Maximum allowed name length.
         min_name_length: Minimum allowed name length.
+        auto_title_case: Whether names are converted to title case.
     """
     
-    def __init__(self, **kwargs):
+    default_strategy: str = 'formal'
+    enable_logging: bool = True
+    max_name_length: int = 50
+    min_name_length: int = 2
+    auto_title_case: bool = True
+    
+    def __post_init__(self) -> None:
         """
-        Initialize configuration with optional overrides.
+        Reject invalid settings at construction time.
         
-        Args:
-            **kwargs: Configuration options to override defaults.
+        Raises:
+            ConfigurationError: If the configuration is invalid.
         """
-        self.default_strategy = kwargs.get('default_strategy', 'formal')
-        self.enable_logging = kwargs.get('enable_logging', True)
-        self.max_name_length = kwargs.get('max_name_length', 50)
-        self.min_name_length = kwargs.get('min_name_length', 2)
-        self.auto_title_case = kwargs.get('auto_title_case', True)
+        if not self.validate():
+            raise ConfigurationError(
+                "INVALID_CONFIG",
+                "The provided configuration is not valid"
+            )
     
     def validate(self) -> bool:
         """
@@ -356,23 +553,23 @@ class WelcomeConfiguration:
         Returns:
             True if configuration is valid, False otherwise.
         """
-        if self.min_name_length < 1:
-            return False
-        if self.max_name_length < self.min_name_length:
+        if not 1 <= self.min_name_length <= self.max_name_length:
             return False
-        if self.default_strategy not in ['formal', 'casual', 'professional']:
-            return False
-        return True
+        return self.default_strategy in _VALID_STRATEGIES
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary for serialization."""
-        return {
-            'default_strategy': self.default_strategy,
-            'enable_logging': self.enable_logging,
-            'max_name_length': self.max_name_length,
-            'min_name_length': self.min_name_length,
-            'auto_title_case': self.auto_title_case
-        }
+        return asdict(self)
+    
+    @cached_property
+    def as_dict(self) -> Mapping[str, Any]:
+        """
+        Read-only mapping of the configuration, built once per instance.
+        
+        The configuration is frozen, so the cached view never goes stale.
+        It is shared between callers; use to_dict() for a mutable copy.
+        """
+        return MappingProxyType(asdict(self))
 
 
 class WelcomeServiceBuilder:
@@ -424,27 +621,19 @@ class WelcomeServiceBuilder:
             A fully configured WelcomeService instance.
             
         Raises:
-            ConfigurationError: If the configuration is invalid.
+            ConfigurationError: If the configured strategy is unknown.
         """
-        if not self._config.validate():
-            raise ConfigurationError(
-                "INVALID_CONFIG",
-                "The provided configuration is not valid"
-            )
-        
         # Create strategy based on configuration if not explicitly set
         if self._strategy is None:
-            strategy_map = {
-                'formal': FormalWelcomeStrategy(),
-                'casual': CasualWelcomeStrategy(),
-                'professional': ProfessionalWelcomeStrategy()
-            }
-            self._strategy = strategy_map.get(
-                self._config.default_strategy,
-                FormalWelcomeStrategy()
-            )
-        
-        service = WelcomeService(self._strategy)
+            strategy = _STRATEGY_REGISTRY.get(self._config.default_strategy)
+            if strategy is None:
+                raise ConfigurationError(
+                    "UNKNOWN_STRATEGY",
+                    f"Unknown strategy type: {self._config.default_strategy}"
+                )
+            self._strategy = strategy
+        
+        service = WelcomeService(self._strategy, enable_logging=self._config.enable_logging)
         return service
 
 
@@ -458,12 +647,17 @@ class WelcomeRepository:
     welcome data while hiding the storage implementation.
     """
     
+    __slots__ = ('_storage', '_by_name', '_next_id')
+    
     def __init__(self):
         """Initialize with in-memory storage for demonstration."""
         self._storage = []
+        # Records grouped by name so lookups don't scan the whole storage
+        self._by_name: Dict[str, List[Dict[str, Any]]] = {}
         self._next_id = 1
     
-    def save(self, name: str, message: str, strategy: str) -> int:
+    def save(self, name: str, message: str, strategy: str,
+             timestamp: Optional[str] = None) -> int:
         """
         Save a welcome record to the repository.
         
@@ -471,6 +665,7 @@ class WelcomeRepository:
             name: The name that was welcomed.
             message: The welcome message.
             strategy: The strategy used.
+            timestamp: ISO timestamp of the welcome; defaults to now.
             
         Returns:
             The ID of the saved record.
@@ -480,9 +675,10 @@ class WelcomeRepository:
             'name': name,
             'message': message,
             'strategy': strategy,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp or _now().isoformat()
         }
         self._storage.append(record)
+        self._by_name.setdefault(name, []).append(record)
         self._next_id += 1
         return record['id']
     
@@ -496,16 +692,40 @@ class WelcomeRepository:
         Returns:
             List of matching welcome records.
         """
-        return [record for record in self._storage if record['name'] == name]
+        return list(self._by_name.get(name, ()))
+    
+    def __len__(self) -> int:
+        """Number of stored welcome records."""
+        return len(self._storage)
+    
+    def count(self) -> int:
+        """
+        Count the stored welcome records without copying them.
+        
+        Returns:
+            Number of welcome records in the repository.
+        """
+        return len(self._storage)
+    
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Get a copy of all welcome records.
+        
+        Returns:
+            List of all welcome records, safe for the caller to modify.
+        """
+        return self._storage.copy()
     
     def get_all(self) -> List[Dict[str, Any]]:
         """
         Get all welcome records.
         
+        Kept for existing callers; equivalent to snapshot().
+        
         Returns:
             List of all welcome records.
         """
-        return self._storage.copy()
+        return self.snapshot()
     
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -564,28 +784,21 @@ class WelcomeManager:
         Raises:
             ValidationError: If the name is invalid.
         """
-        try:
-            # Generate welcome message
-            message = self.service.welcome_user(name)
-            
-            # Persist to repository
-            self.repository.save(
-                name=name,
-                message=message,
-                strategy=self.service.strategy.__class__.__name__
-            )
-            
-            return message
-            
-        except ValidationError:
-            # Re-raise validation errors
-            raise
-        except Exception as e:
-            # Wrap other exceptions in domain-specific exception
-            raise WelcomeException(
-                "SYSTEM_ERROR",
-                f"An error occurred while welcoming user: {str(e)}"
-            )
+        # One timestamp shared by the service log and the stored record
+        timestamp = _now().isoformat()
+        
+        # Generate welcome message
+        message = self.service.welcome_user(name, timestamp=timestamp)
+        
+        # Persist to repository
+        self.repository.save(
+            name=name,
+            message=message,
+            strategy=self.service.strategy_name,
+            timestamp=timestamp
+        )
+        
+        return message
     
     def change_strategy(self, strategy_type: str) -> None:
         """
@@ -597,19 +810,14 @@ class WelcomeManager:
         Raises:
             ConfigurationError: If the strategy type is unknown.
         """
-        strategy_map = {
-            'formal': FormalWelcomeStrategy(),
-            'casual': CasualWelcomeStrategy(),
-            'professional': ProfessionalWelcomeStrategy()
-        }
-        
-        if strategy_type not in strategy_map:
+        strategy = _STRATEGY_REGISTRY.get(strategy_type)
+        if strategy is None:
             raise ConfigurationError(
                 "UNKNOWN_STRATEGY",
                 f"Unknown strategy type: {strategy_type}"
             )
         
-        self.service.set_strategy(strategy_map[strategy_type])
+        self.service.set_strategy(strategy)
     
     def get_system_report(self) -> Dict[str, Any]:
         """
@@ -619,12 +827,11 @@ class WelcomeManager:
             Dictionary containing system statistics and status.
         """
         service_stats = self.service.get_usage_statistics()
-        all_records = self.repository.get_all()
         
         return {
             'service_statistics': service_stats,
-            'total_records': len(all_records),
-            'configuration': self.config.to_dict(),
+            'total_records': len(self.repository),
+            'configuration': dict(self.config.as_dict),
             'system_status': 'operational',
             'report_generated': datetime.now().isoformat()
         }
@@ -639,6 +846,8 @@ class WelcomeContextManager:
     ensure clean-up operations are performed.
     """
     
+    __slots__ = ('manager', 'operation_count')
+    
     def __init__(self, manager: WelcomeManager):
         """
         Initialize with a welcome manager.
@@ -656,7 +865,7 @@ class WelcomeContextManager:
         Returns:
             self for use in with statements.
         """
-        print("Welcome context manager started")
+        logger.debug("Welcome context manager started")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
@@ -671,11 +880,13 @@ class WelcomeContextManager:
         Returns:
             True if exception was handled, False otherwise.
         """
-        print(f"Welcome context manager completed. Operations: {self.operation_count}")
+        logger.debug("Welcome context manager completed. Operations: %d", self.operation_count)
         
-        # Log completion statistics
-        report = self.manager.get_system_report()
-        print(f"Final statistics: {report['service_statistics']['total_welcomes']} welcomes")
+        # Log completion statistics; the report is only built when it will be shown
+        if logger.isEnabledFor(logging.DEBUG):
+            report = self.manager.get_system_report()
+            logger.debug("Final statistics: %d welcomes",
+                         report['service_statistics']['total_welcomes'])
         
         # Don't suppress exceptions
         return False
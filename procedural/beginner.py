@@ -6,6 +6,8 @@ This module demonstrates various simple procedural ways to get a user's name
 and display a welcome message, focusing on basic Python concepts.
 """
 
+import sys
+
 # Solution 1: Most Basic Approach
 
 
@@ -57,7 +59,7 @@ def welcome_multiple_vars():
     greeting_end = "!"
 
     name = input(prompt)
-    full_greeting = greeting_start + name + greeting_end
+    full_greeting = f"{greeting_start}{name}{greeting_end}"
     print(full_greeting)
 
 
@@ -158,14 +160,52 @@ def welcome_complete_beginner():
     # Remove any extra spaces from the beginning and end
     cleaned_name = name.strip()
 
-    # Create the welcome message by combining strings
-    welcome_message = "Welcome, " + cleaned_name + "!"
+    # Create the welcome message with an f-string
+    welcome_message = f"Welcome, {cleaned_name}!"
 
     # Display the welcome message to the user
     # print() function shows the message on the screen
     print(welcome_message)
 
 
+# Menu entries: choice -> (description, solution), built once at import
+_SOLUTIONS = {
+    '1': ("Most Basic", welcome_basic),
+    '2': ("F-String", welcome_fstring),
+    '3': ("Format Method", welcome_format),
+    '4': ("Multiple Variables", welcome_multiple_vars),
+    '5': ("Percent Format", welcome_percent_format),
+    '6': ("With Function", welcome_with_function),
+    '7': ("With Validation", welcome_with_validation),
+    '8': ("With Constant", welcome_with_constant),
+    '9': ("Title Case", welcome_title_case),
+    '10': ("Complete Beginner", welcome_complete_beginner)
+}
+
+_MENU_TEXT = '\n'.join(
+    ["Procedural Programming - Beginner Level",
+     "Choose a solution to test (1-10):"]
+    + [f"{key}. {description}" for key, (description, _) in _SOLUTIONS.items()]
+    + ["0. Exit"])
+
+
+def _prompt(prompt: str) -> str:
+    """
+    Read one line of input for the menu.
+
+    Interactive terminals go through input() to keep line editing; piped
+    or redirected stdin is read directly, skipping input()'s extra flushes.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
+
 def main():
     """
     Main function to demonstrate all solutions.
@@ -173,37 +213,18 @@ def main():
     This function provides a menu to choose and test
     different implementations of the welcome message.
     """
-    solutions = {
-        '1': ("Most Basic", welcome_basic),
-        '2': ("F-String", welcome_fstring),
-        '3': ("Format Method", welcome_format),
-        '4': ("Multiple Variables", welcome_multiple_vars),
-        '5': ("Percent Format", welcome_percent_format),
-        '6': ("With Function", welcome_with_function),
-        '7': ("With Validation", welcome_with_validation),
-        '8': ("With Constant", welcome_with_constant),
-        '9': ("Title Case", welcome_title_case),
-        '10': ("Complete Beginner", welcome_complete_beginner)
-    }
-
-    print("Procedural Programming - Beginner Level")
-    print("Choose a solution to test (1-10):")
-
-    for key, (description, procedure) in solutions.items():
-        print(f"{key}. {description}")
-
-    print("0. Exit")
+    print(_MENU_TEXT)
 
     while True:
-        choice = input("\nEnter your choice: ").strip()
+        choice = _prompt("\nEnter your choice: ").strip()
 
         if choice == '0':
             print("Goodbye!")
             break
-        elif choice in solutions:
-            print(f"\nTesting: {solutions[choice][0]}")
+        elif choice in _SOLUTIONS:
+            print(f"\nTesting: {_SOLUTIONS[choice][0]}")
             try:
-                procedure = solutions[choice][1]
+                procedure = _SOLUTIONS[choice][1]
                 procedure()
             except KeyboardInterrupt:
                 print("\n\nOperation cancelled by user.")
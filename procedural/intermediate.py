@@ -9,11 +9,76 @@ including error handling, data validation, and code organization.
 
 import re
 import json
-from datetime import datetime
+import string
+import sys
+from time import localtime, perf_counter_ns
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
 
+# Performance note: these solutions are string- and input-bound. JIT
+# compilers such as numba only handle str in object mode, which is slower
+# than plain CPython and adds compile time at import, so they are not used.
+# Speedups here come from compiled regexes and C-level str/set operations.
+
+# Regular expressions compiled once and shared by the solutions below
+_NAME_RE = re.compile(r'^[A-Za-z\s\-]+$')
+_EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_MULTI_WS_RE = re.compile(r'\s+')
+_SUSPICIOUS_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'[<>]',  # HTML tags
+    r'[{}]',  # Code injection
+    r'script',  # Script tags
+    r'http',  # URLs
+))
+
+# Characters _NAME_RE accepts: ASCII letters, hyphens and any whitespace
+# (str.isspace, which is what \s means in re, tops out at U+3000)
+_ALLOWED = frozenset(string.ascii_letters + '-').union(
+    c for c in map(chr, range(0x3001)) if c.isspace())
+
+# Name checks in order, paired with the error reported when one fails
+_NAME_CHECKS = (
+    (lambda name: bool(name), "Name cannot be empty. Please try again."),
+    (lambda name: len(name) >= 2, "Name must be at least 2 characters long."),
+    (lambda name: len(name) <= 50, "Name cannot exceed 50 characters."),
+    (_ALLOWED.issuperset, "Name can only contain letters, spaces, and hyphens."),
+)
+
+# ASCII input (the common case) is checked for digits in C via isdisjoint
+_ASCII_DIGITS = frozenset('0123456789')
+
+# Greeting for each hour of the day, indexed by tm_hour
+_HOUR_GREETING = tuple(
+    "Good morning" if 5 <= hour < 12 else
+    "Good afternoon" if 12 <= hour < 18 else
+    "Good evening"
+    for hour in range(24)
+)
+
+
+def _contains_digit(text: str) -> bool:
+    """Check for digits, using a C-level set test for ASCII text."""
+    if text.isascii():
+        return not _ASCII_DIGITS.isdisjoint(text)
+    return any(c.isdigit() for c in text)
+
+
+def _clean_title(text: str) -> str:
+    """Strip text and title-case it, skipping title() for empty input."""
+    text = text.strip()
+    return text.title() if text else text
+
+
+def _hms() -> str:
+    """Return the current local time as HH:MM:SS."""
+    now = localtime()
+    return f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+
+
 # Solution 1: Comprehensive input validation
+# perf: str-heavy, not a JIT target (see note at top)
 def welcome_with_comprehensive_validation():
     """
     Advanced input validation with multiple checks.
@@ -29,28 +94,12 @@ def welcome_with_comprehensive_validation():
     while True:
         name = input("Please enter your name: ").strip()
 
-        # Check for empty input
-        if not name:
-            print("Error: Name cannot be empty. Please try again.")
-            continue
-
-        # Check minimum length
-        if len(name) < 2:
-            print("Error: Name must be at least 2 characters long.")
-            continue
-
-        # Check maximum length
-        if len(name) > 50:
-            print("Error: Name cannot exceed 50 characters.")
-            continue
-
-        # Check for alphabetic characters (allowing spaces and hyphens)
-        if not re.match(r'^[A-Za-z\s\-]+$', name):
-            print("Error: Name can only contain letters, spaces, and hyphens.")
-            continue
-
-        # If all checks pass
-        break
+        # Report the first failed check, if any
+        error = next((message for check, message in _NAME_CHECKS
+                      if not check(name)), None)
+        if error is None:
+            break
+        print(f"Error: {error}")
 
     print(f"Welcome, {name.title()}!")
 
@@ -67,14 +116,7 @@ def welcome_with_time_greeting():
     """
     print("Welcome with Time-Based Greeting")
 
-    current_hour = datetime.now().hour
-
-    if 5 <= current_hour < 12:
-        time_greeting = "Good morning"
-    elif 12 <= current_hour < 18:
-        time_greeting = "Good afternoon"
-    else:
-        time_greeting = "Good evening"
+    time_greeting = _HOUR_GREETING[localtime().tm_hour]
 
     name = input("What's your name? ").strip()
 
@@ -144,7 +186,7 @@ def welcome_with_user_profile():
     # Get optional email
     email = input("Enter your email (optional): ").strip()
     if email:
-        if re.match(r'^[^@]+@[^@]+\.[^@]+$', email):
+        if _EMAIL_RE.match(email):
             user_profile['email'] = email
         else:
             print("Warning: Email format invalid. Skipping email storage.")
@@ -155,12 +197,12 @@ def welcome_with_user_profile():
         user_profile['title'] = title
 
     # Generate welcome message
-    welcome_msg = f"Welcome, {user_profile['name']}"
+    parts = ["Welcome, ", user_profile['name']]
     if 'title' in user_profile:
-        welcome_msg += f" ({user_profile['title']})"
-    welcome_msg += "! We're excited to have you here."
+        parts.append(f" ({user_profile['title']})")
+    parts.append("! We're excited to have you here.")
 
-    print(welcome_msg)
+    print(''.join(parts))
 
     # Display profile summary
     if len(user_profile) > 1:
@@ -179,17 +221,17 @@ def welcome_with_greeting_history():
     """
     print("Welcome with Greeting History")
 
-    greeting_history = []
-    session_start = datetime.now()
+    # History kept as parallel columns, one entry per index
+    names: list[str] = []
+    greetings: list[str] = []
+    timestamps: list[str] = []
+    session_start = _hms()
 
     def add_to_history(user_name: str, greeting: str):
         """Add a greeting to the history with timestamp."""
-        entry = {
-            'name': user_name,
-            'greeting': greeting,
-            'timestamp': datetime.now().strftime("%H:%M:%S")
-        }
-        greeting_history.append(entry)
+        names.append(user_name)
+        greetings.append(greeting)
+        timestamps.append(_hms())
 
     while True:
         name = input(
@@ -199,14 +241,13 @@ def welcome_with_greeting_history():
             break
         elif name.lower() == 'history':
             # Display greeting history
-            if not greeting_history:
+            if not names:
                 print("No greetings recorded yet.")
             else:
                 print(
-                    f"\nGreeting History (Session started at {session_start.strftime('%H:%M:%S')}):")
-                for i, entry in enumerate(greeting_history, 1):
-                    print(
-                        f"   {i}. {entry['greeting']} at {entry['timestamp']}")
+                    f"\nGreeting History (Session started at {session_start}):")
+                for i, (greeting, timestamp) in enumerate(zip(greetings, timestamps), 1):
+                    print(f"   {i}. {greeting} at {timestamp}")
             continue
 
         if not name:
@@ -214,16 +255,27 @@ def welcome_with_greeting_history():
             continue
 
         # Create personalized greeting
-        greeting = f"Hello, {name}! You're visitor #{len(greeting_history) + 1}"
+        greeting = f"Hello, {name}! You're visitor #{len(names) + 1}"
         print(greeting)
 
         # Add to history
         add_to_history(name, greeting)
 
-    print(f"\nSession Summary: {len(greeting_history)} greetings recorded.")
+    print(f"\nSession Summary: {len(names)} greetings recorded.")
 
 
 # Solution 6: With configuration settings
+# Configuration settings, read-only and built once at import
+WELCOME_CONFIG = MappingProxyType({
+    'min_name_length': 2,
+    'max_name_length': 30,
+    'default_greeting': 'Welcome',
+    'allow_numbers': False,
+    'auto_title_case': True,
+    'max_attempts': 3
+})
+
+
 def welcome_with_configuration():
     """
     Configurable welcome system using settings.
@@ -233,49 +285,49 @@ def welcome_with_configuration():
     """
     print("Welcome with Configuration")
 
-    # Configuration settings
-    CONFIG = {
-        'min_name_length': 2,
-        'max_name_length': 30,
-        'default_greeting': 'Welcome',
-        'allow_numbers': False,
-        'auto_title_case': True,
-        'max_attempts': 3
-    }
-
-    def validate_name(name: str) -> tuple[bool, str]:
+    # Read configuration settings into locals once
+    min_length = WELCOME_CONFIG['min_name_length']
+    max_length = WELCOME_CONFIG['max_name_length']
+    default_greeting = WELCOME_CONFIG['default_greeting']
+    auto_title_case = WELCOME_CONFIG['auto_title_case']
+    max_attempts = WELCOME_CONFIG['max_attempts']
+
+    def validate_name(name: str, min_length: int = min_length,
+                      max_length: int = max_length,
+                      allow_numbers: bool = WELCOME_CONFIG['allow_numbers']
+                      ) -> tuple[bool, str]:
         """Validate name based on configuration."""
         if not name:
             return False, "Name cannot be empty."
 
-        if len(name) < CONFIG['min_name_length']:
-            return False, f"Name must be at least {CONFIG['min_name_length']} characters."
+        if len(name) < min_length:
+            return False, f"Name must be at least {min_length} characters."
 
-        if len(name) > CONFIG['max_name_length']:
-            return False, f"Name cannot exceed {CONFIG['max_name_length']} characters."
+        if len(name) > max_length:
+            return False, f"Name cannot exceed {max_length} characters."
 
-        if not CONFIG['allow_numbers'] and any(char.isdigit() for char in name):
+        if not allow_numbers and _contains_digit(name):
             return False, "Name cannot contain numbers."
 
         return True, "Valid"
 
     attempts = 0
-    while attempts < CONFIG['max_attempts']:
+    while attempts < max_attempts:
         name = input("Please enter your name: ").strip()
         is_valid, message = validate_name(name)
 
         if is_valid:
             # Format name based on configuration
-            if CONFIG['auto_title_case']:
+            if auto_title_case:
                 name = name.title()
 
-            print(f"{CONFIG['default_greeting']}, {name}!")
+            print(f"{default_greeting}, {name}!")
             break
         else:
             attempts += 1
-            print(f"Error: {message} (Attempt {attempts}/{CONFIG['max_attempts']})")
+            print(f"Error: {message} (Attempt {attempts}/{max_attempts})")
 
-    if attempts >= CONFIG['max_attempts']:
+    if attempts >= max_attempts:
         print("Too many failed attempts. Please try again later.")
 
 
@@ -343,6 +395,21 @@ def welcome_with_error_handling():
 
 
 # Solution 8: With greeting templates
+# Template library
+GREETING_TEMPLATES = {
+    'formal': "Dear {name}, it is our distinct pleasure to welcome you.",
+    'casual': "Hey {name}! Great to see you!",
+    'friendly': "Hello {name}! We're so happy you're here!",
+    'professional': "Welcome {name}. We look forward to working with you.",
+    'enthusiastic': "WOW! {name} is here! Let's get started!"
+}
+
+# Style names in menu order and the numbered menu shown to the user
+_TEMPLATE_KEYS = tuple(GREETING_TEMPLATES)
+_TEMPLATE_MENU = '\n'.join(
+    f"{i}. {key.capitalize()}" for i, key in enumerate(_TEMPLATE_KEYS, 1))
+
+
 def welcome_with_templates():
     """
     Template-based greeting system.
@@ -352,36 +419,22 @@ def welcome_with_templates():
     """
     print("Welcome with Templates")
 
-    # Template library
-    GREETING_TEMPLATES = {
-        'formal': "Dear {name}, it is our distinct pleasure to welcome you.",
-        'casual': "Hey {name}! Great to see you!",
-        'friendly': "Hello {name}! We're so happy you're here!",
-        'professional': "Welcome {name}. We look forward to working with you.",
-        'enthusiastic': "WOW! {name} is here! Let's get started!"
-    }
-
     print("Choose your greeting style:")
-    for i, (key, template) in enumerate(GREETING_TEMPLATES.items(), 1):
-        print(f"{i}. {key.capitalize()}")
+    print(_TEMPLATE_MENU)
 
     while True:
         try:
             choice = int(input("Enter your choice (1-5): ").strip())
             if 1 <= choice <= len(GREETING_TEMPLATES):
-                selected_style = list(GREETING_TEMPLATES.keys())[choice - 1]
+                selected_style = _TEMPLATE_KEYS[choice - 1]
                 break
             else:
                 print("Error: Please enter a number between 1 and 5.")
         except ValueError:
             print("Error: Please enter a valid number.")
 
-    name = input("What's your name? ").strip()
-    if not name:
-        name = "Guest"
-
-    # Format name
-    formatted_name = name.title()
+    # Clean and format name in one step, falling back to a guest
+    formatted_name = _clean_title(input("What's your name? ")) or "Guest"
 
     # Generate greeting using template
     greeting_template = GREETING_TEMPLATES[selected_style]
@@ -391,6 +444,7 @@ def welcome_with_templates():
 
 
 # Solution 9: With input sanitization
+# perf: str-heavy, not a JIT target (see note at top)
 def welcome_with_sanitization():
     """
     Advanced input sanitization and security.
@@ -411,10 +465,10 @@ def welcome_with_sanitization():
         sanitized = text.strip()
 
         # Remove any HTML tags
-        sanitized = re.sub(r'<[^>]+>', '', sanitized)
+        sanitized = _HTML_TAG_RE.sub('', sanitized)
 
         # Remove excessive whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = _MULTI_WS_RE.sub(' ', sanitized)
 
         # Limit length
         sanitized = sanitized[:50]
@@ -432,15 +486,8 @@ def welcome_with_sanitization():
             return False, "Name is too short."
 
         # Check for suspicious patterns
-        suspicious_patterns = [
-            r'.*[<>].*',  # HTML tags
-            r'.*[{}].*',  # Code injection
-            r'.*script.*',  # Script tags
-            r'.*http.*',   # URLs
-        ]
-
-        for pattern in suspicious_patterns:
-            if re.match(pattern, name, re.IGNORECASE):
+        for pattern in _SUSPICIOUS_RES:
+            if pattern.search(name):
                 return False, "Name contains suspicious characters."
 
         return True, "Name is safe"
@@ -467,69 +514,102 @@ def welcome_with_performance_monitoring():
     """
     print("Welcome with Performance Monitoring")
 
-    import time
-
-    def timed_input(prompt: str) -> tuple[Optional[str], float]:
-        """Get input with timing measurement."""
-        start_time = time.time()
+    def timed_input(prompt: str) -> tuple[Optional[str], int]:
+        """Get input with timing measurement in nanoseconds."""
+        start_ns = perf_counter_ns()
         try:
             user_input = input(prompt).strip()
-            end_time = time.time()
-            return user_input, end_time - start_time
-        except:
-            end_time = time.time()
-            return None, end_time - start_time
+            return user_input, perf_counter_ns() - start_ns
+        except (EOFError, KeyboardInterrupt):
+            return None, perf_counter_ns() - start_ns
 
-    def timed_validation(name: str) -> tuple[bool, float]:
-        """Validate name with timing."""
-        start_time = time.time()
+    def timed_validation(name: str) -> tuple[bool, int]:
+        """Validate name with timing in nanoseconds."""
+        start_ns = perf_counter_ns()
 
         # Perform validation checks
         is_valid = (
             name and
             len(name) >= 2 and
             len(name) <= 50 and
-            re.match(r'^[A-Za-z\s\-]+$', name)
+            _NAME_RE.match(name)
         )
 
-        end_time = time.time()
-        return is_valid, end_time - start_time
+        return is_valid, perf_counter_ns() - start_ns
 
     # Monitor total execution time
-    total_start_time = time.time()
+    total_start_ns = perf_counter_ns()
 
     # Get input with timing
-    name, input_time = timed_input("Please enter your name: ")
+    name, input_ns = timed_input("Please enter your name: ")
 
     if name is None:
         print("Error: Input was cancelled.")
         return
 
     # Validate with timing
-    is_valid, validation_time = timed_validation(name)
+    is_valid, validation_ns = timed_validation(name)
 
     if is_valid:
         # Generate greeting
-        greeting_start = time.time()
+        greeting_start_ns = perf_counter_ns()
         formatted_name = name.title()
         greeting = f"Welcome, {formatted_name}!"
-        greeting_time = time.time() - greeting_start
+        greeting_ns = perf_counter_ns() - greeting_start_ns
 
         # Display results
         print(greeting)
 
-        # Performance report
-        total_time = time.time() - total_start_time
+        # Performance report, converted to seconds only for display
+        total_ns = perf_counter_ns() - total_start_ns
         print(f"\nPerformance Report:")
-        print(f"\tInput time: {input_time:.4f} seconds")
-        print(f"\tValidation time: {validation_time:.4f} seconds")
-        print(f"\tGreeting generation: {greeting_time:.4f} seconds")
-        print(f"\tTotal execution: {total_time:.4f} seconds")
+        print(f"\tInput time: {input_ns * 1e-9:.4f} seconds")
+        print(f"\tValidation time: {validation_ns * 1e-9:.4f} seconds")
+        print(f"\tGreeting generation: {greeting_ns * 1e-9:.4f} seconds")
+        print(f"\tTotal execution: {total_ns * 1e-9:.4f} seconds")
 
     else:
         print("Error: Invalid name provided.")
 
 
+# Menu entries: choice -> (description, solution), built once at import
+_SOLUTIONS = {
+    '1': ("Comprehensive Validation", welcome_with_comprehensive_validation),
+    '2': ("Time-Based Greeting", welcome_with_time_greeting),
+    '3': ("Language Selection", welcome_with_language_selection),
+    '4': ("User Profile", welcome_with_user_profile),
+    '5': ("Greeting History", welcome_with_greeting_history),
+    '6': ("Configuration Settings", welcome_with_configuration),
+    '7': ("Error Handling", welcome_with_error_handling),
+    '8': ("Greeting Templates", welcome_with_templates),
+    '9': ("Input Sanitization", welcome_with_sanitization),
+    '10': ("Performance Monitoring", welcome_with_performance_monitoring)
+}
+
+_MENU_TEXT = '\n'.join(
+    ["Procedural Programming - Intermediate Level",
+     "Choose a solution to test (1-10):"]
+    + [f"{key}. {description}" for key, (description, _) in _SOLUTIONS.items()]
+    + ["0. Exit"])
+
+
+def _prompt(prompt: str) -> str:
+    """
+    Read one line of input for the menu.
+
+    Interactive terminals go through input() to keep line editing; piped
+    or redirected stdin is read directly, skipping input()'s extra flushes.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
+
 def main():
     """
     Main function to demonstrate all intermediate solutions.
@@ -537,37 +617,18 @@ def main():
     Provides an interactive menu to test different intermediate
     implementations of the welcome message system.
     """
-    solutions = {
-        '1': ("Comprehensive Validation", welcome_with_comprehensive_validation),
-        '2': ("Time-Based Greeting", welcome_with_time_greeting),
-        '3': ("Language Selection", welcome_with_language_selection),
-        '4': ("User Profile", welcome_with_user_profile),
-        '5': ("Greeting History", welcome_with_greeting_history),
-        '6': ("Configuration Settings", welcome_with_configuration),
-        '7': ("Error Handling", welcome_with_error_handling),
-        '8': ("Greeting Templates", welcome_with_templates),
-        '9': ("Input Sanitization", welcome_with_sanitization),
-        '10': ("Performance Monitoring", welcome_with_performance_monitoring)
-    }
-
-    print("Procedural Programming - Intermediate Level")
-    print("Choose a solution to test (1-10):")
-
-    for key, (description, procedure) in solutions.items():
-        print(f"{key}. {description}")
-
-    print("0. Exit")
+    print(_MENU_TEXT)
 
     while True:
-        choice = input("\nEnter your choice: ").strip()
+        choice = _prompt("\nEnter your choice: ").strip()
 
         if choice == '0':
             print("Goodbye!")
             break
-        elif choice in solutions:
-            print(f"\nTesting: {solutions[choice][0]}")
+        elif choice in _SOLUTIONS:
+            print(f"\nTesting: {_SOLUTIONS[choice][0]}")
             try:
-                procedure = solutions[choice][1]
+                procedure = _SOLUTIONS[choice][1]
                 procedure()
             except KeyboardInterrupt:
                 print("\n\nOperation cancelled by user.")